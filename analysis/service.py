@@ -4,14 +4,74 @@ This class wraps analytical SQL queries and Python-based visualizations
 to offer insight into launches, rockets, payloads, and performance metrics.
 """
 
+import csv
+import functools
+from collections.abc import Callable
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")  # File-only rendering; never initialize an interactive backend
+
+import matplotlib.dates as mdates  # noqa: E402
+import matplotlib.pyplot as plt  # noqa: E402
 
 from core.logging import LOGGER
 from data.sqlite_database import SQLiteDatabase
 
+# Query results persisted between runs; entries are keyed by the database's mtime
+QUERY_CACHE_DIR = Path("analysis/.cache")
+
+plt.rcParams.update(
+    {
+        "path.simplify_threshold": 1.0,
+        "agg.path.chunksize": 10000,
+        "text.usetex": False,
+        "font.family": "DejaVu Sans",  # Bundled with matplotlib; skips font fallback lookups
+    }
+)
+
+
+def _skip_if_unchanged(*outputs: str) -> Callable:
+    """Skips an analysis that already succeeded on this analyzer against the same data.
+
+    A run only counts once the method reports success. It is repeated whenever the
+    database fingerprint changes or any of its output files has gone missing; the
+    database layer rebuilds its own caches on the next query after a change. The
+    fingerprint only stats the files, so a missing database is reported by the
+    analysis itself.
+
+    The memo lives on the analyzer instance, so this only saves work for callers that
+    reuse one analyzer across runs. `main.py` builds a fresh analyzer for each run and
+    calls every analysis once, so the command-line pipeline never skips.
+
+    Args:
+        *outputs (str): Files the analysis writes.
+
+    Returns:
+        Callable: Decorator for analysis methods that return True on success.
+    """
+    def decorator(method: Callable[["MissionAnalyzer"], bool]) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self: "MissionAnalyzer") -> bool:
+            fingerprint = self.db.fingerprint()
+            if (
+                self._completed.get(method.__name__) == fingerprint
+                and all(Path(output).exists() for output in outputs)
+            ):
+                LOGGER.info(f"Skipping {method.__name__}; database unchanged since last run.")
+                return True
+
+            self._completed.pop(method.__name__, None)
+            succeeded = method(self)
+            if succeeded:
+                self._completed[method.__name__] = fingerprint
+            return succeeded
+
+        return wrapper
+
+    return decorator
+
 
 class MissionAnalyzer:
     """Provides data analysis and statistical insight generation for SpaceX launch data.
@@ -29,9 +89,34 @@ class MissionAnalyzer:
         Returns:
             None
         """
-        self.db = SQLiteDatabase(db_path)
+        self.db = SQLiteDatabase(db_path, cache_dir=QUERY_CACHE_DIR)
+
+        # Database fingerprint each analysis last ran against, by method name
+        self._completed: dict[str, tuple] = {}
+
+        # One Figure/Axes pair is reused by every chart to skip per-plot figure setup
+        self._fig, self._ax = plt.subplots()
+
+    def clear_query_cache(self) -> None:
+        """Invalidates cached query results and analyses so the next run re-reads the DB."""
+        self.db.clear_cache()
+        self._completed.clear()
+
+    def close(self) -> None:
+        """Closes the underlying database connection and releases the shared figure."""
+        self.db.close()
+        plt.close(self._fig)
+
+    def __enter__(self) -> "MissionAnalyzer":
+        """Returns the analyzer for use in a `with` block."""
+        return self
 
-    def launches_per_year(self) -> None:
+    def __exit__(self, *exc_info: object) -> None:
+        """Releases the connection and figure when leaving a `with` block."""
+        self.close()
+
+    @_skip_if_unchanged("analysis/plots/launches_per_year.png")
+    def launches_per_year(self) -> bool:
         """Displays a summary table and bar chart of the number of launches per year.
 
         Why it's useful:
@@ -41,7 +126,7 @@ class MissionAnalyzer:
             None
 
         Returns:
-            None
+            bool: True if the outputs were written.
         """
         LOGGER.info("Analyzing launches per year.")
 
@@ -50,35 +135,39 @@ class MissionAnalyzer:
         except Exception as ex:
             LOGGER.error("Failed to run SQL query for launches per year.")
             LOGGER.exception(ex)
-            return
+            return False
 
         if dataframe.empty:
             LOGGER.warning("No data returned for launches per year.")
-            return
+            return False
 
         plot_path = Path("analysis/plots/launches_per_year.png")
 
         try:
+            self._ax.clear()
             dataframe.plot(
                 x="year",
                 y="launch_count",
                 kind="bar",
                 legend=False,
-                title="Launches per Year"
+                title="Launches per Year",
+                ax=self._ax
             )
-            plt.ylabel("Number of Launches")
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            self._ax.set_ylabel("Number of Launches")
+            self._fig.tight_layout()
+            self._fig.savefig(plot_path)
 
             LOGGER.info(f"✅ Saved launch trend chart to {plot_path}")
+            return True
 
         except Exception as ex:
 
             LOGGER.error("Failed to render or save the plot.")
             LOGGER.exception(ex)
+            return False
 
-    def rocket_success_rates(self) -> None:
+    @_skip_if_unchanged("analysis/plots/rocket_success_rates.png")
+    def rocket_success_rates(self) -> bool:
         """Displays success rates for each rocket, highlighting reliability.
 
         Why it's useful:
@@ -89,7 +178,7 @@ class MissionAnalyzer:
             None
 
         Returns:
-            None
+            bool: True if the outputs were written.
         """
         LOGGER.info("Analyzing rocket success rates...")
 
@@ -99,11 +188,11 @@ class MissionAnalyzer:
         except Exception as ex:
             LOGGER.error("Failed to compute rocket success rates.")
             LOGGER.exception(ex)
-            return
+            return False
 
         if dataframe.empty:
             LOGGER.warning("No rocket launch data available.")
-            return
+            return False
 
         # Highlight rockets with perfect record
         perfect_rockets = dataframe[dataframe["success_rate"] == 100.0]
@@ -114,27 +203,31 @@ class MissionAnalyzer:
         # Plotting
         plot_path = Path("analysis/plots/rocket_success_rates.png")
         try:
+            self._ax.clear()
             dataframe.plot(
                 x="rocket",
                 y="success_rate",
                 kind="bar",
                 legend=False,
-                title="Rocket Success Rates"
+                title="Rocket Success Rates",
+                ax=self._ax
             )
-            plt.ylabel("Success Rate (%)")
-            plt.xticks(rotation=45, ha="right")
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            self._ax.set_ylabel("Success Rate (%)")
+            plt.setp(self._ax.get_xticklabels(), rotation=45, ha="right")
+            self._fig.tight_layout()
+            self._fig.savefig(plot_path)
 
             LOGGER.info(f"✅ Saved rocket success rate chart to {plot_path}")
+            return True
 
         except Exception as ex:
 
             LOGGER.error("Failed to render or save rocket success rate plot.")
             LOGGER.exception(ex)
+            return False
 
-    def payload_mass_over_time(self) -> None:
+    @_skip_if_unchanged("analysis/plots/payload_mass_over_time.png")
+    def payload_mass_over_time(self) -> bool:
         """Visualizes payload mass over time to show mission scale and evolution.
 
         Why it's useful:
@@ -145,41 +238,52 @@ class MissionAnalyzer:
             None
 
         Returns:
-            None
+            bool: True if the outputs were written.
         """
         LOGGER.info("Analyzing payload mass over time...")
 
         try:
-            dataframe = self.db.get_payload_mass_over_time()
+            dates, mass = self.db.get_payload_mass_over_time()
         except Exception as ex:
             LOGGER.error("Failed to retrieve payload mass data.")
             LOGGER.exception(ex)
-            return
+            return False
 
-        if dataframe.empty:
+        if mass.size == 0:
             LOGGER.warning("No payload mass data available.")
-            return
-
-        dataframe["date"] = pd.to_datetime(dataframe["date_utc"])
+            return False
 
         plot_path = Path("analysis/plots/payload_mass_over_time.png")
 
         try:
-            dataframe.plot.scatter(x="date", y="mass_kg", alpha=0.5, title="Payload Mass Over Time")
-            plt.ylabel("Mass (kg)")
-            plt.xlabel("Launch Date")
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            self._ax.clear()
+            # Hex-binned density draws O(gridsize²) cells instead of one marker per payload
+            self._ax.hexbin(
+                mdates.date2num(dates),
+                mass,
+                gridsize=50,
+                bins="log",
+                mincnt=1,
+                alpha=0.7
+            )
+            self._ax.xaxis_date()
+            self._ax.set_title("Payload Mass Over Time")
+            self._ax.set_ylabel("Mass (kg)")
+            self._ax.set_xlabel("Launch Date")
+            self._fig.tight_layout()
+            self._fig.savefig(plot_path)
 
             LOGGER.info(f"✅ Saved payload mass trend chart to {plot_path}")
+            return True
 
         except Exception as ex:
 
             LOGGER.error("Failed to render or save payload mass plot.")
             LOGGER.exception(ex)
+            return False
 
-    def launchpad_performance(self) -> None:
+    @_skip_if_unchanged("analysis/plots/launchpad_performance.png")
+    def launchpad_performance(self) -> bool:
         """Analyzes launchpad usage and reliability.
 
         Why it's useful:
@@ -190,7 +294,7 @@ class MissionAnalyzer:
             None
 
         Returns:
-            None
+            bool: True if the outputs were written.
         """
         LOGGER.info("Analyzing launchpad performance...")
 
@@ -200,34 +304,43 @@ class MissionAnalyzer:
         except Exception as ex:
             LOGGER.error("Failed to query launchpad performance.")
             LOGGER.exception(ex)
-            return
+            return False
 
         if dataframe.empty:
             LOGGER.warning("No launchpad performance data found.")
-            return
+            return False
 
         plot_path = Path("analysis/plots/launchpad_performance.png")
         try:
+            self._ax.clear()
             dataframe.plot.barh(
                 x="launchpad",
                 y="success_rate",
                 legend=False,
-                title="Launchpad Success Rates"
+                title="Launchpad Success Rates",
+                ax=self._ax
             )
-            plt.xlabel("Success Rate (%)")
-            plt.xlim(0, 100)
-            plt.tight_layout()
-            plt.savefig(plot_path)
-            plt.close()
+            self._ax.set_xlabel("Success Rate (%)")
+            self._ax.set_xlim(0, 100)
+            self._fig.tight_layout()
+            self._fig.savefig(plot_path)
 
             LOGGER.info(f"✅ Saved launchpad performance chart to {plot_path}")
+            return True
 
         except Exception as ex:
 
             LOGGER.error("Failed to render or save launchpad performance plot.")
             LOGGER.exception(ex)
-
-    def plan_successful_launch(self) -> None:
+            return False
+
+    @_skip_if_unchanged(
+        "analysis/plots/top_launchpad_configs.csv",
+        "analysis/plots/orbit_mass_profiles.csv",
+        "analysis/plots/success_by_year.csv",
+        "analysis/plots/launch_recommendation.md"
+    )
+    def plan_successful_launch(self) -> bool:
         """Analyzes mission data to identify statistically reliable launch configurations.
 
         Why it's useful:
@@ -235,24 +348,23 @@ class MissionAnalyzer:
         - Synthesizes multi-factor insights across rocket, launchpad, payload, and orbit
 
         Returns:
-            None
+            bool: True if the outputs were written.
         """
         LOGGER.info("Planning ideal mission configuration based on historical success rates...")
 
         try:
             # 1. Rocket + Launchpad Pair Success
-            rocket_pad_df = self.db.get_rocket_launchpad_combinations()
+            rocket_pad_df = self.db.get_rocket_launchpad_combinations(limit=5)
 
-            rocket_pad_df.head(5).to_csv("analysis/plots/top_launchpad_configs.csv", index=False)
+            rocket_pad_df.to_csv("analysis/plots/top_launchpad_configs.csv", index=False)
 
             # 2. Orbit + Mass Bin Success
-            orbit_mass_df = self.db.get_orbit_mass_profiles()
-            orbit_mass_df.head(5).to_csv("analysis/plots/orbit_mass_profiles.csv", index=False)
+            orbit_mass_df = self.db.get_orbit_mass_profiles(limit=5)
+            orbit_mass_df.to_csv("analysis/plots/orbit_mass_profiles.csv", index=False)
 
             # 3. Success Rate by Year
             year_df = self.db.get_success_by_year()
 
-            year_df["year"] = year_df["year"].astype(int)
             recent_years = year_df[year_df["year"] >= 2018]
             avg_recent = round(recent_years["success_rate"].mean(), 2)
             year_df.tail(5).to_csv("analysis/plots/success_by_year.csv", index=False)
@@ -276,12 +388,15 @@ class MissionAnalyzer:
             Path("analysis/plots/launch_recommendation.md").write_text(summary_md)
 
             LOGGER.info("✅ Launch plan summary and supporting CSVs written to analysis/plots/")
+            return True
 
         except Exception as ex:
             LOGGER.error("Failed to generate mission planning output.")
             LOGGER.exception(ex)
+            return False
 
-    def analyze_config_stability(self) -> None:
+    @_skip_if_unchanged("analysis/plots/config_stability.csv")
+    def analyze_config_stability(self) -> bool:
         """Analyzes the stability of rocket + launchpad configurations over time.
 
         This method calculates the year-by-year success rate for each configuration
@@ -290,6 +405,9 @@ class MissionAnalyzer:
 
         Outputs:
             - CSV: analysis/plots/config_stability.csv
+
+        Returns:
+            bool: True if the outputs were written.
         """
         LOGGER.info("Analyzing configuration stability over time...")
 
@@ -303,12 +421,15 @@ class MissionAnalyzer:
 
             stats.to_csv("analysis/plots/config_stability.csv", index=False)
             LOGGER.info("✅ Saved configuration stability analysis to config_stability.csv")
+            return True
 
         except Exception as ex:
             LOGGER.error("Failed to analyze configuration stability.")
             LOGGER.exception(ex)
+            return False
 
-    def detect_rocket_fatigue(self) -> None:
+    @_skip_if_unchanged("analysis/plots/rocket_fatigue.csv")
+    def detect_rocket_fatigue(self) -> bool:
         """Detects performance drift across sequential launches for each rocket.
 
         Assigns a launch number to each rocket over time and correlates launch number
@@ -316,30 +437,26 @@ class MissionAnalyzer:
 
         Outputs:
             - CSV: analysis/plots/rocket_fatigue.csv
+
+        Returns:
+            bool: True if the outputs were written.
         """
         LOGGER.info("Detecting rocket fatigue and sequential performance trends...")
 
         try:
-            dataframe = self.db.get_rocket_sequential_launches()
-
-            dataframe["launch_number"] = (
-                dataframe.groupby("rocket")["date_utc"]
-                .rank(method="first")
-                .astype(int)
-            )
-            dataframe["success"] = dataframe["success"].astype(int)
-
-            grouped = dataframe.groupby(["rocket", "launch_number"]).agg(
-                launches=("success", "count"),
-                successful=("success", "sum")
-            ).reset_index()
-
-            grouped["success_rate"] = (100 * grouped["successful"] / grouped["launches"]).round(2)
-
-            grouped.to_csv("analysis/plots/rocket_fatigue.csv", index=False)
+            # launch_number and the per-launch rate are computed in SQL; rows stream
+            # straight to the CSV without building a DataFrame
+            cursor = self.db.iter_rocket_fatigue_rows()
+
+            with open("analysis/plots/rocket_fatigue.csv", "w", newline="") as file:
+                writer = csv.writer(file, lineterminator="\n")
+                writer.writerow(column[0] for column in cursor.description)
+                writer.writerows(cursor)
             LOGGER.info("✅ Saved rocket fatigue trend data to rocket_fatigue.csv")
+            return True
 
         except Exception as ex:
             LOGGER.error("Failed to analyze rocket fatigue.")
             LOGGER.exception(ex)
+            return False
 
@@ -8,16 +8,77 @@ Author: Nathan A. Lucy
 Email: nathanalucy@gmail.com
 """
 
-import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pandas as pd
 import streamlit as st
-from dotenv import load_dotenv
-from PIL import Image
+
+from core.env import get_openai_api_key
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 st.set_page_config(page_title="LaunchLens", layout="wide")
 
+
+@st.cache_data(show_spinner=False)
+def _load_csv(path: str, mtime_ns: int) -> "pd.DataFrame":
+    """Parses a CSV once per file version; `mtime_ns` invalidates the cached copy."""
+    import pandas as pd  # Deferred so reports that never read a CSV skip the import
+
+    return pd.read_csv(path)
+
+
+@st.cache_data(show_spinner=False)
+def _load_text(path: str, mtime_ns: int) -> str:
+    """Reads a text file once per file version; `mtime_ns` invalidates the cached copy."""
+    return Path(path).read_text()
+
+
+@st.cache_data(show_spinner=False)
+def _load_bytes(path: str, mtime_ns: int) -> bytes:
+    """Reads a binary file once per file version; `mtime_ns` invalidates the cached copy."""
+    return Path(path).read_bytes()
+
+
+def load_csv(path: Path) -> "pd.DataFrame":
+    """Returns a CSV as a DataFrame, reusing the parsed copy across Streamlit reruns.
+
+    Args:
+        path (Path): Path to the CSV file.
+
+    Returns:
+        pd.DataFrame: Parsed CSV contents.
+    """
+    return _load_csv(str(path), path.stat().st_mtime_ns)
+
+
+def load_text(path: Path) -> str:
+    """Returns a text file's contents, reusing the cached copy across Streamlit reruns.
+
+    Args:
+        path (Path): Path to the text file.
+
+    Returns:
+        str: File contents.
+    """
+    return _load_text(str(path), path.stat().st_mtime_ns)
+
+
+def load_image(path: Path) -> bytes:
+    """Returns a chart's encoded PNG bytes, reusing the cached copy across Streamlit reruns.
+
+    The bytes are handed to `st.image` as-is, so the PNG is never decoded server-side.
+
+    Args:
+        path (Path): Path to the image file.
+
+    Returns:
+        bytes: Encoded image contents.
+    """
+    return _load_bytes(str(path), path.stat().st_mtime_ns)
+
+
 st.title("🚀 LaunchLens Dashboard")
 st.markdown("Analyze historical SpaceX launch data with visual insights and machine "
             "learning–powered predictions."
@@ -42,28 +103,28 @@ if key == "launch_planner":
     st.subheader("🚀 Top Rocket + Launchpad Configurations")
     pad_path = Path("analysis/plots/top_launchpad_configs.csv")
     if pad_path.exists():
-        st.dataframe(pd.read_csv(pad_path))
+        st.dataframe(load_csv(pad_path))
     else:
         st.info("Rocket + Launchpad data not found.")
 
     st.subheader("📦 Best Orbit + Payload Mass Profiles")
     orbit_path = Path("analysis/plots/orbit_mass_profiles.csv")
     if orbit_path.exists():
-        st.dataframe(pd.read_csv(orbit_path))
+        st.dataframe(load_csv(orbit_path))
     else:
         st.info("Orbit + payload profile data not found.")
 
     st.subheader("📆 Success Rate by Year")
     year_path = Path("analysis/plots/success_by_year.csv")
     if year_path.exists():
-        st.dataframe(pd.read_csv(year_path))
+        st.dataframe(load_csv(year_path))
     else:
         st.info("Success by year data not found.")
 
     st.subheader("🧾 Recommended Launch Profile")
     rec_path = Path("analysis/plots/launch_recommendation.md")
     if rec_path.exists():
-        st.markdown(rec_path.read_text())
+        st.markdown(load_text(rec_path))
     else:
         st.info("Recommendation summary not found.")
 
@@ -86,8 +147,7 @@ if key == "launch_planner":
     # 💬 Natural Language Query (RAG)
     st.subheader("💬 Ask a Question About the Launch Data")
 
-    load_dotenv()
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    OPENAI_API_KEY = get_openai_api_key()
 
     if OPENAI_API_KEY:
         user_question = st.text_area(
@@ -99,11 +159,9 @@ if key == "launch_planner":
         if st.button("Ask LaunchLens") and user_question.strip():
             with st.spinner("Thinking..."):
                 try:
-                    from rag.query_engine import query_launchlens
-                    response = query_launchlens(user_question)
-                    if response:
-                        st.success(response)
-                    else:
+                    from rag.query_engine import stream_launchlens
+                    response = st.write_stream(stream_launchlens(user_question))
+                    if not response:
                         st.warning("No answer was returned.")
                 except Exception as ex:
                     st.error("Query failed.")
@@ -120,7 +178,7 @@ elif key == "advanced_insights":
     st.subheader("📊 Configuration Stability by Rocket + Launchpad")
     stability_path = Path("analysis/plots/config_stability.csv")
     if stability_path.exists():
-        df = pd.read_csv(stability_path)
+        df = load_csv(stability_path)
         st.dataframe(df)
     else:
         st.info("Stability data not available.")
@@ -128,15 +186,14 @@ elif key == "advanced_insights":
     st.subheader("📉 Rocket Fatigue Over Sequential Launches")
     fatigue_path = Path("analysis/plots/rocket_fatigue.csv")
     if fatigue_path.exists():
-        df = pd.read_csv(fatigue_path)
+        df = load_csv(fatigue_path)
         st.dataframe(df)
     else:
         st.info("Fatigue analysis not available.")
 
     st.subheader("💬 Ask a Question About These Insights")
 
-    load_dotenv()
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    OPENAI_API_KEY = get_openai_api_key()
 
     if OPENAI_API_KEY:
         user_question = st.text_area(
@@ -148,11 +205,9 @@ elif key == "advanced_insights":
         if st.button("Ask (Advanced)") and user_question.strip():
             with st.spinner("Thinking..."):
                 try:
-                    from rag.query_engine import query_launchlens
-                    response = query_launchlens(user_question)
-                    if response:
-                        st.success(response)
-                    else:
+                    from rag.query_engine import stream_launchlens
+                    response = st.write_stream(stream_launchlens(user_question))
+                    if not response:
                         st.warning("No answer was returned.")
                 except Exception as e:
                     st.error("Query failed.")
@@ -168,16 +223,18 @@ elif key == "advanced_insights":
 
 # --- Standard case: Plot + optional summary ---
 else:
-    image_path = os.path.join("analysis", "plots", f"{key}.png")
-    text_path = os.path.join("analysis", "plots", f"{key}.txt")
+    image_path = Path("analysis/plots") / f"{key}.png"
+    text_path = Path("analysis/plots") / f"{key}.txt"
+
+    # Check each file once per rerun and reuse the result below
+    image_exists = image_path.exists()
+    text_exists = text_path.exists()
 
-    if os.path.exists(image_path):
-        image = Image.open(image_path)
-        st.image(image, caption=selection)
+    if image_exists:
+        st.image(load_image(image_path), caption=selection)
 
-    if os.path.exists(text_path):
-        with open(text_path) as f:
-            st.markdown(f"**Summary:**\n\n{f.read()}")
+    if text_exists:
+        st.markdown(f"**Summary:**\n\n{load_text(text_path)}")
 
-    if not os.path.exists(image_path) and not os.path.exists(text_path):
+    if not image_exists and not text_exists:
         st.error("No content available for this report.")
@@ -0,0 +1,21 @@
+"""Resolves environment configuration shared across the LaunchLens project.
+
+Usage:
+    from core.env import get_openai_api_key
+    api_key = get_openai_api_key()
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+
+def get_openai_api_key() -> str | None:
+    """Returns the OpenAI API key, reading `.env` only when it isn't already exported.
+
+    Returns:
+        str | None: The configured API key, or None if it is not set anywhere.
+    """
+    if "OPENAI_API_KEY" not in os.environ:
+        load_dotenv()
+    return os.environ.get("OPENAI_API_KEY")
@@ -23,6 +23,9 @@ handler = logging.StreamHandler()
 formatter = logging.Formatter("[%(levelname)s] %(message)s")
 handler.setFormatter(formatter)
 
-# Attach the handler (only once)
-if not LOGGER.handlers:
+# Attach the handler (only once, even if this module is re-executed, e.g. by Streamlit)
+if not any(isinstance(existing, logging.StreamHandler) for existing in LOGGER.handlers):
     LOGGER.addHandler(handler)
+
+# Don't also emit every record through the root logger's handlers
+LOGGER.propagate = False
@@ -47,7 +47,8 @@ CREATE TABLE IF NOT EXISTS launches (
     id TEXT PRIMARY KEY,
     name TEXT NOT NULL,
     date_utc TEXT NOT NULL,
-    success BOOLEAN,
+    year INTEGER GENERATED ALWAYS AS (CAST(strftime('%Y', date_utc) AS INTEGER)) STORED,
+    success BOOLEAN CHECK (success IN (0, 1)),
     rocket_id TEXT,
     launchpad_id TEXT,
     FOREIGN KEY (rocket_id) REFERENCES rockets(id),
@@ -63,7 +64,9 @@ CREATE TABLE IF NOT EXISTS launch_payload (
     FOREIGN KEY (payload_id) REFERENCES payloads(id)
 );
 
--- Indexes for query speed
-CREATE INDEX IF NOT EXISTS idx_launches_date ON launches(date_utc);
-CREATE INDEX IF NOT EXISTS idx_launches_rocket ON launches(rocket_id);
-CREATE INDEX IF NOT EXISTS idx_payloads_mass ON payloads(mass_kg);
+-- Indexes for query speed (composite with success so aggregations are index-only)
+CREATE INDEX IF NOT EXISTS idx_launches_date ON launches(date_utc, success);
+CREATE INDEX IF NOT EXISTS idx_launches_rocket ON launches(rocket_id, success);
+CREATE INDEX IF NOT EXISTS idx_launches_pad ON launches(launchpad_id, success);
+CREATE INDEX IF NOT EXISTS idx_payloads_mass ON payloads(mass_kg) WHERE mass_kg IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_launch_payload_payload ON launch_payload(payload_id, launch_id);
@@ -1,117 +1,447 @@
 """Provides a centralized interface for querying structured SpaceX launch data.
 
-All query methods return pandas DataFrames and encapsulate reusable SQL used across
+Query methods return pandas DataFrames (or plain NumPy arrays for plot-only series, and
+raw cursors for rows streamed straight to CSV) and encapsulate reusable SQL used across
 the analysis layer.
 """
 
+import hashlib
+import os
 import sqlite3
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+QUERY_CACHE_SIZE = 64
+
+# Julian day number of the Unix epoch, for converting SQLite julianday() values
+UNIX_EPOCH_JULIAN_DAY = 2440587.5
+MS_PER_DAY = 86_400_000
+
+# Denormalized per-launch view shared by every analysis query. Materialized per connection
+# so the launches/rockets/launchpads join is resolved a single time, and rebuilt whenever
+# the database fingerprint changes. Kept as a TEMP table so it is never written to the
+# database file. `{year}` is filled in by `_year_expression`.
+LAUNCH_FLAT_SQL = """
+    DROP TABLE IF EXISTS temp.launch_flat;
+    CREATE TEMP TABLE launch_flat AS
+    SELECT
+        l.id,
+        l.date_utc,
+        {year} AS year,
+        l.success,
+        r.name AS rocket,
+        lp.name AS launchpad
+    FROM launches l
+    LEFT JOIN rockets r ON l.rocket_id = r.id
+    LEFT JOIN launchpads lp ON l.launchpad_id = lp.id;
+    CREATE INDEX temp.idx_launch_flat_id ON launch_flat(id);
+    CREATE INDEX temp.idx_launch_flat_year ON launch_flat(year);
+    CREATE INDEX temp.idx_launch_flat_rocket ON launch_flat(rocket, launchpad);
+    CREATE INDEX temp.idx_launch_flat_launchpad ON launch_flat(launchpad);
+"""
+
+# Label dtype of each `get_dashboard_aggregates` breakdown
+DASHBOARD_LABEL_DTYPES = {"year": "int64", "rocket": "object", "launchpad": "object"}
+
+
+def _limit_clause(limit: int | None) -> str:
+    """Returns a SQL LIMIT clause, or an empty string when no limit is requested."""
+    return "" if limit is None else f"LIMIT {int(limit)}"
+
 
 class SQLiteDatabase:
     """Encapsulates reusable SQL queries for accessing SpaceX launch data from SQLite."""
 
-    def __init__(self, db_path: Path) -> None:
-        """Initializes the database connection.
+    def __init__(
+        self,
+        db_path: Path,
+        cache_dir: Path | None = None
+    ) -> None:
+        """Initializes the database interface.
+
+        The connection is opened on first use and then held for the lifetime of the
+        instance, so SQLite's page cache stays warm across every query issued by the
+        analysis layer. Constructing an instance never touches the database file.
 
         Args:
             db_path (Path): Path to the SQLite database file.
+            cache_dir (Path | None): Directory for persisting query results across runs.
+                Disk caching is disabled when omitted.
         """
-        self.connection = sqlite3.connect(db_path)
+        self.db_path = Path(db_path)
+        self.cache_dir = cache_dir
 
-    def get_launches_per_year(self) -> pd.DataFrame:
-        """Returns the number of launches per year."""
-        return pd.read_sql_query(
-            """
-            SELECT strftime('%Y', date_utc) AS year, COUNT(*) AS launch_count
-            FROM launches
-            GROUP BY year
-            ORDER BY year ASC;
-            """,
-            self.connection,
+        self._connection: sqlite3.Connection | None = None
+        self._query_cache: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        # Fingerprint of the database contents `launch_flat` was built from
+        self._fingerprint: tuple | None = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Returns the database connection, opening it on first use.
+
+        The file is opened without SQLite's create flag, so a missing database raises
+        `sqlite3.OperationalError` instead of leaving an empty file behind.
+
+        Returns:
+            sqlite3.Connection: Connection shared by every query on this instance.
+        """
+        if self._connection is None:
+            uri = f"{self.db_path.resolve().as_uri()}?mode=rw"
+            connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            connection.executescript(
+                """
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA cache_size=-65536;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+                """
+            )
+            self._connection = connection
+
+        return self._connection
+
+    def refresh(self) -> tuple:
+        """Rebuilds `launch_flat` and drops cached results if the database has changed.
+
+        Skipped inside a transaction, where every query must keep reading the snapshot
+        the transaction started with. The fingerprint is re-read after each rebuild, so
+        a write that lands mid-rebuild triggers another one.
+
+        Returns:
+            tuple: Fingerprint of the database state that query results now reflect.
+        """
+        if self.connection.in_transaction:
+            return self._fingerprint
+
+        fingerprint = self.fingerprint()
+        while fingerprint != self._fingerprint:
+            self._query_cache.clear()
+            self.connection.executescript(
+                LAUNCH_FLAT_SQL.format(year=self._year_expression())
+            )
+            self._fingerprint, fingerprint = fingerprint, self.fingerprint()
+
+        return self._fingerprint
+
+    def _year_expression(self) -> str:
+        """Returns the SQL expression for a launch's year.
+
+        Databases built from the current schema store it as a generated `year` column;
+        older files without that column derive it from `date_utc` instead.
+
+        Returns:
+            str: Column reference or expression over the `launches` alias `l`.
+        """
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_xinfo(launches)")}
+        if "year" in columns:
+            return "l.year"
+        return "CAST(strftime('%Y', l.date_utc) AS INTEGER)"
+
+    def query(self, sql: str, dtype: dict[str, str] | None = None) -> pd.DataFrame:
+        """Runs a SELECT statement, serving repeated statements from an in-memory cache.
+
+        Rows are fetched from the cursor in one batch and handed straight to the
+        DataFrame constructor, skipping pandas' generic SQL adapter layer. Results are
+        keyed by the whitespace-normalized SQL text, the requested dtypes, and the
+        fingerprint of the data `launch_flat` was built from.
+        Callers always receive a copy, so mutating the returned frame never affects
+        later cache hits.
+
+        Args:
+            sql (str): SQL query to execute.
+            dtype (dict[str, str] | None): Explicit column dtypes, applied while reading
+                instead of inferring them and converting afterwards.
+
+        Returns:
+            pd.DataFrame: Query results.
+        """
+        self.refresh()
+
+        key = (
+            " ".join(sql.split()),
+            tuple(sorted((dtype or {}).items())),
+            self._fingerprint
         )
+        cached = self._query_cache.get(key)
 
-    def get_rocket_success_rates(self) -> pd.DataFrame:
-        """Returns total launches and success rate per rocket."""
-        return pd.read_sql_query(
+        if cached is None:
+            cached = self._read_disk_cache(key)
+            if cached is None:
+                cursor = self.connection.execute(sql)
+                columns = [column[0] for column in cursor.description]
+                cached = pd.DataFrame.from_records(
+                    cursor.fetchall(), columns=columns, coerce_float=True
+                )
+                if dtype:
+                    cached = cached.astype(dtype)
+                self._write_disk_cache(key, cached)
+            self._query_cache[key] = cached
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        else:
+            self._query_cache.move_to_end(key)
+
+        return cached.copy()
+
+    def fingerprint(self) -> tuple[tuple[str, int, int], ...]:
+        """Returns the size and modification time of the database and its non-empty WAL.
+
+        Any committed write changes the fingerprint, so it can key results derived from
+        the current database contents.
+
+        Returns:
+            tuple[tuple[str, int, int], ...]: (file name, size, mtime in ns) per file.
+        """
+        fingerprint = []
+        for path in (self.db_path, self.db_path.with_name(f"{self.db_path.name}-wal")):
+            # An empty WAL holds no uncheckpointed pages, and is recreated per connection
+            if path.exists() and (stat := path.stat()).st_size:
+                fingerprint.append((path.name, stat.st_size, stat.st_mtime_ns))
+        return tuple(fingerprint)
+
+    def _disk_cache_path(self, key: tuple) -> Path | None:
+        """Returns the on-disk cache file for a query key, or None if caching is disabled.
+
+        The query key already carries the fingerprint `launch_flat` was built from, so
+        a result is only ever stored under the database state it was computed against.
+        File names start with a digest of that fingerprint alone, which lets
+        `_write_disk_cache` find entries left over from earlier database states.
+
+        Args:
+            key (tuple): Normalized SQL text, dtype items and fingerprint, as built by
+                `query`.
+
+        Returns:
+            Path | None: Location of the pickled result.
+        """
+        if self.cache_dir is None:
+            return None
+
+        key_digest = hashlib.sha1(repr(key).encode()).hexdigest()
+        return self.cache_dir / f"{self._fingerprint_digest()}-{key_digest}.pkl"
+
+    def _fingerprint_digest(self) -> str:
+        """Returns a short digest of the fingerprint `launch_flat` was built from."""
+        return hashlib.sha1(repr(self._fingerprint).encode()).hexdigest()[:16]
+
+    def _read_disk_cache(self, key: tuple) -> pd.DataFrame | None:
+        """Loads a previously persisted query result, if one exists for the key."""
+        path = self._disk_cache_path(key)
+        if path is None or not path.exists():
+            return None
+        return pd.read_pickle(path)
+
+    def _write_disk_cache(self, key: tuple, dataframe: pd.DataFrame) -> None:
+        """Persists a query result atomically, so a crash never leaves a truncated pickle.
+
+        Results computed against any other database state can never be read again, so
+        they are deleted first; the directory only ever holds the current state's
+        entries.
+        """
+        path = self._disk_cache_path(key)
+        if path is None:
+            return
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        current_prefix = f"{self._fingerprint_digest()}-"
+        for stale_path in path.parent.glob("*.pkl"):
+            if not stale_path.name.startswith(current_prefix):
+                stale_path.unlink(missing_ok=True)
+
+        tmp_path = path.with_suffix(".tmp")
+        dataframe.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+    def clear_cache(self) -> None:
+        """Drops cached query results (in memory and on disk).
+
+        `launch_flat` is rebuilt by the next query.
+        """
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.pkl"):
+                path.unlink(missing_ok=True)
+        self._query_cache.clear()
+        self._fingerprint = None
+
+    @contextmanager
+    def read_transaction(self) -> Iterator[None]:
+        """Runs the enclosed queries inside a single read transaction.
+
+        Every statement then reads from the same database snapshot, and SQLite takes the
+        shared lock once instead of once per SELECT. `launch_flat` is brought up to date
+        before the transaction starts.
+        """
+        try:
+            self.refresh()
+        except sqlite3.Error:
+            # Missing or unreadable database; the enclosed queries raise the same error
+            # where their callers already log it.
+            yield
+            return
+
+        self.connection.execute("BEGIN")
+        try:
+            yield
+        finally:
+            self.connection.execute("COMMIT")
+
+    def get_dashboard_aggregates(self) -> pd.DataFrame:
+        """Returns launch totals and success rates per year, rocket, and launchpad.
+
+        The three dashboard breakdowns are fetched in a single tagged UNION ALL
+        statement, so they share one parse/plan/fetch round trip and one cache entry.
+        The `dimension` column identifies which breakdown each row belongs to.
+        """
+        return self.query(
             """
             SELECT
-                r.name AS rocket,
+                'year' AS dimension,
+                year AS label,
                 COUNT(*) AS total_launches,
-                SUM(CASE WHEN l.success THEN 1 ELSE 0 END) AS successful,
+                COALESCE(SUM(success), 0) AS successful,
                 ROUND(
-                    100.0 * SUM(CASE WHEN l.success THEN 1 ELSE 0 END) / COUNT(*),
+                    100.0 * COALESCE(SUM(success), 0) / COUNT(*),
                     2
                 ) AS success_rate
-            FROM launches l
-            JOIN rockets r ON l.rocket_id = r.id
-            GROUP BY r.name
-            ORDER BY success_rate DESC;
-            """,
-            self.connection,
+            FROM launch_flat
+            GROUP BY year
+            UNION ALL
+            SELECT
+                'rocket',
+                rocket,
+                COUNT(*),
+                COALESCE(SUM(success), 0),
+                ROUND(100.0 * COALESCE(SUM(success), 0) / COUNT(*), 2)
+            FROM launch_flat
+            WHERE rocket IS NOT NULL
+            GROUP BY rocket
+            UNION ALL
+            SELECT
+                'launchpad',
+                launchpad,
+                COUNT(*),
+                COALESCE(SUM(success), 0),
+                ROUND(100.0 * COALESCE(SUM(success), 0) / COUNT(*), 2)
+            FROM launch_flat
+            WHERE launchpad IS NOT NULL
+            GROUP BY launchpad
+            """
+        )
+
+    def _dashboard_slice(self, dimension: str) -> pd.DataFrame:
+        """Returns one breakdown of `get_dashboard_aggregates`, labelled by dimension.
+
+        The shared `label` column mixes integer years with rocket and launchpad names, so
+        it comes back as object dtype; each slice restores its own label type.
+
+        Args:
+            dimension (str): One of "year", "rocket", or "launchpad".
+
+        Returns:
+            pd.DataFrame: Rows for the requested dimension, without the tag column.
+        """
+        dataframe = self.get_dashboard_aggregates()
+        return (
+            dataframe[dataframe["dimension"] == dimension]
+            .drop(columns="dimension")
+            .astype({"label": DASHBOARD_LABEL_DTYPES[dimension]})
+            .rename(columns={"label": dimension})
         )
 
-    def get_payload_mass_over_time(self) -> pd.DataFrame:
-        """Returns payload mass and launch dates for all launches with valid mass."""
-        return pd.read_sql_query(
+    def get_launches_per_year(self) -> pd.DataFrame:
+        """Returns the number of launches per year."""
+        years = self._dashboard_slice("year").sort_values("year", kind="mergesort")
+        return years[["year", "total_launches"]].rename(
+            columns={"total_launches": "launch_count"}
+        ).reset_index(drop=True)
+
+    def get_rocket_success_rates(self) -> pd.DataFrame:
+        """Returns total launches and success rate per rocket."""
+        rockets = self._dashboard_slice("rocket")
+        return rockets.sort_values(
+            ["success_rate", "rocket"],
+            ascending=[False, True],
+            kind="mergesort"
+        ).reset_index(drop=True)
+
+    def get_payload_mass_over_time(self) -> tuple[np.ndarray, np.ndarray]:
+        """Returns launch dates and payload masses for all payloads with valid mass.
+
+        Dates are converted to Julian days inside SQLite and streamed straight into
+        NumPy, avoiding a DataFrame and per-row datetime string parsing.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: `datetime64[ms]` launch dates and float64 masses.
+        """
+        self.refresh()
+        cursor = self.connection.execute(
             """
-            SELECT p.mass_kg, l.date_utc
+            SELECT julianday(l.date_utc), p.mass_kg
             FROM payloads p
             JOIN launch_payload lp ON p.id = lp.payload_id
-            JOIN launches l ON l.id = lp.launch_id
+            JOIN launch_flat l ON l.id = lp.launch_id
             WHERE p.mass_kg IS NOT NULL
-            """,
-            self.connection,
+            """
         )
+        values = np.array(cursor.fetchall(), dtype=np.float64).reshape(-1, 2)
+
+        dates = ((values[:, 0] - UNIX_EPOCH_JULIAN_DAY) * MS_PER_DAY).astype("datetime64[ms]")
+        return dates, values[:, 1]
 
     def get_launchpad_performance(self) -> pd.DataFrame:
         """Returns launchpad usage and success metrics."""
-        return pd.read_sql_query(
-            """
-            SELECT
-                lp.name AS launchpad,
-                COUNT(*) AS total_launches,
-                SUM(CASE WHEN l.success THEN 1 ELSE 0 END) AS successful,
-                ROUND(
-                    100.0 * SUM(CASE WHEN l.success THEN 1 ELSE 0 END) / COUNT(*),
-                    2
-                ) AS success_rate
-            FROM launches l
-            JOIN launchpads lp ON l.launchpad_id = lp.id
-            GROUP BY lp.name
-            ORDER BY total_launches DESC;
-            """,
-            self.connection,
-        )
+        launchpads = self._dashboard_slice("launchpad")
+        return launchpads.sort_values(
+            ["total_launches", "launchpad"],
+            ascending=[False, True],
+            kind="mergesort"
+        ).reset_index(drop=True)
+
+    def get_rocket_launchpad_combinations(self, limit: int | None = None) -> pd.DataFrame:
+        """Returns launch success rate for each rocket + launchpad pair.
+
+        Args:
+            limit (int | None): Only return the top `limit` pairs.
 
-    def get_rocket_launchpad_combinations(self) -> pd.DataFrame:
-        """Returns launch success rate for each rocket + launchpad pair."""
-        return pd.read_sql_query(
+        Returns:
+            pd.DataFrame: Pairs ordered from most to least successful.
+        """
+        return self.query(
             """
             SELECT
-                r.name AS rocket,
-                lp.name AS launchpad,
+                rocket,
+                launchpad,
                 COUNT(*) AS launches,
-                SUM(CASE WHEN l.success THEN 1 ELSE 0 END) AS successful,
+                COALESCE(SUM(success), 0) AS successful,
                 ROUND(
-                    100.0 * SUM(CASE WHEN l.success THEN 1 ELSE 0 END) / COUNT(*),
+                    100.0 * COALESCE(SUM(success), 0) / COUNT(*),
                     2
                 ) AS success_rate
-            FROM launches l
-            JOIN rockets r ON l.rocket_id = r.id
-            JOIN launchpads lp ON l.launchpad_id = lp.id
-            GROUP BY r.name, lp.name
+            FROM launch_flat
+            WHERE rocket IS NOT NULL AND launchpad IS NOT NULL
+            GROUP BY rocket, launchpad
             HAVING launches >= 3
-            ORDER BY success_rate DESC, launches DESC
-            """,
-            self.connection,
+            ORDER BY success_rate DESC, launches DESC, rocket, launchpad
+            """ + _limit_clause(limit)
         )
 
-    def get_orbit_mass_profiles(self) -> pd.DataFrame:
-        """Returns success rate across orbit and payload mass bins."""
-        return pd.read_sql_query(
+    def get_orbit_mass_profiles(self, limit: int | None = None) -> pd.DataFrame:
+        """Returns success rate across orbit and payload mass bins.
+
+        Args:
+            limit (int | None): Only return the top `limit` orbit/mass bins.
+
+        Returns:
+            pd.DataFrame: Bins ordered from most to least successful.
+        """
+        return self.query(
             """
             SELECT
                 p.orbit,
@@ -121,83 +451,93 @@ class SQLiteDatabase:
                     ELSE '2000+ kg'
                 END AS mass_bin,
                 COUNT(*) AS missions,
-                SUM(CASE WHEN l.success THEN 1 ELSE 0 END) AS successful,
+                COALESCE(SUM(l.success), 0) AS successful,
                 ROUND(
-                    100.0 * SUM(CASE WHEN l.success THEN 1 ELSE 0 END) / COUNT(*),
+                    100.0 * COALESCE(SUM(l.success), 0) / COUNT(*),
                     2
                 ) AS success_rate
             FROM payloads p
             JOIN launch_payload lp ON p.id = lp.payload_id
-            JOIN launches l ON l.id = lp.launch_id
+            JOIN launch_flat l ON l.id = lp.launch_id
             WHERE p.mass_kg IS NOT NULL AND p.orbit IS NOT NULL
             GROUP BY orbit, mass_bin
             HAVING missions >= 3
-            ORDER BY success_rate DESC, missions DESC
-            """,
-            self.connection,
+            ORDER BY success_rate DESC, missions DESC, orbit, mass_bin
+            """ + _limit_clause(limit)
         )
 
     def get_success_by_year(self) -> pd.DataFrame:
         """Returns yearly launch counts and success rates."""
-        return pd.read_sql_query(
+        return self.query(
             """
             SELECT
-                strftime('%Y', date_utc) AS year,
+                year,
                 COUNT(*) AS launches,
-                SUM(CASE WHEN success THEN 1 ELSE 0 END) AS successful,
+                COALESCE(SUM(success), 0) AS successful,
                 ROUND(
-                    100.0 * SUM(CASE WHEN success THEN 1 ELSE 0 END) / COUNT(*),
+                    100.0 * COALESCE(SUM(success), 0) / COUNT(*),
                     2
                 ) AS success_rate
-            FROM launches
+            FROM launch_flat
             GROUP BY year
             ORDER BY year ASC
             """,
-            self.connection,
+            dtype={"year": "int64"}
         )
 
     def get_config_stability_by_year(self) -> pd.DataFrame:
         """Returns launch success rates over time for each rocket + launchpad combo."""
-        return pd.read_sql_query(
+        return self.query(
             """
             SELECT
-                r.name AS rocket,
-                lp.name AS launchpad,
-                strftime('%Y', l.date_utc) AS year,
+                rocket,
+                launchpad,
+                year,
                 COUNT(*) AS launches,
-                SUM(CASE WHEN l.success THEN 1 ELSE 0 END) AS successful,
+                COALESCE(SUM(success), 0) AS successful,
                 ROUND(
-                    100.0 * SUM(CASE WHEN l.success THEN 1 ELSE 0 END) / COUNT(*),
+                    100.0 * COALESCE(SUM(success), 0) / COUNT(*),
                     2
                 ) AS success_rate
-            FROM launches l
-            JOIN rockets r ON l.rocket_id = r.id
-            JOIN launchpads lp ON l.launchpad_id = lp.id
-            GROUP BY r.name, lp.name, year
+            FROM launch_flat
+            WHERE rocket IS NOT NULL AND launchpad IS NOT NULL
+            GROUP BY rocket, launchpad, year
             HAVING launches >= 2
-            """,
-            self.connection,
+            """
         )
 
-    def get_rocket_sequential_launches(self) -> pd.DataFrame:
-        """Returns rockets and their launches with success flags ordered by time."""
-        return pd.read_sql_query(
+    def iter_rocket_fatigue_rows(self) -> sqlite3.Cursor:
+        """Streams each rocket's launches numbered in date order, with per-launch rates.
+
+        Every row is a single launch, so `launches` is always 1 and `success_rate` is the
+        success flag scaled to a percentage. Rows are yielded straight from the cursor
+        rather than materialized as a DataFrame.
+
+        Returns:
+            sqlite3.Cursor: Cursor over (rocket, launch_number, launches, successful,
+                success_rate) rows; column names are available from `description`.
+        """
+        self.refresh()
+        return self.connection.execute(
             """
             SELECT
-                r.name AS rocket,
-                l.date_utc,
-                l.success
-            FROM launches l
-            JOIN rockets r ON l.rocket_id = r.id
-            WHERE l.success IS NOT NULL
-            ORDER BY r.name, l.date_utc
-            """,
-            self.connection,
+                rocket,
+                ROW_NUMBER() OVER (
+                    PARTITION BY rocket
+                    ORDER BY date_utc
+                ) AS launch_number,
+                1 AS launches,
+                success AS successful,
+                success * 100.0 AS success_rate
+            FROM launch_flat
+            WHERE rocket IS NOT NULL AND success IS NOT NULL
+            ORDER BY rocket, launch_number
+            """
         )
 
     def close(self) -> None:
-        """Closes the database connection."""
-        self.connection.close()
-
-
-
+        """Closes the database connection, if one was opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            self._fingerprint = None
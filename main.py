@@ -17,6 +17,16 @@ from rag.indexer import build_vector_store
 DB_PATH = Path("data/spacex.sqlite")
 SCHEMA_PATH = Path("data/schema.sql")
 
+# MissionAnalyzer jobs, run in order; each writes its own chart or CSV
+ANALYSIS_JOBS = (
+    "launches_per_year",
+    "rocket_success_rates",
+    "payload_mass_over_time",
+    "launchpad_performance",
+    "plan_successful_launch",
+    "analyze_config_stability",
+    "detect_rocket_fatigue",
+)
 
 class MainPipeline:
     """Top-level runner for resetting, ingesting, and analyzing SpaceX data."""
@@ -32,25 +42,45 @@ class MainPipeline:
         self.schema_path = schema_path
 
     def reset_database(self) -> None:
-        """Deletes any existing database file and recreates the schema."""
+        """Deletes any existing database file and recreates the schema.
+
+        The WAL and shared-memory side files are removed too, so a stale WAL from a
+        previous run can never be replayed into the fresh database.
+        """
         if self.db_path.exists():
             self.db_path.unlink()
             LOGGER.info(f"🗑️ Removed existing DB at {self.db_path}")
 
-        with sqlite3.connect(self.db_path) as conn:
+        for suffix in ("-wal", "-shm"):
+            self.db_path.with_name(f"{self.db_path.name}{suffix}").unlink(missing_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
             with open(self.schema_path) as f:
-                conn.executescript(f.read())
+                # The file is brand new, so there is nothing to journal or sync; a crash
+                # here just means rerunning the reset. executescript autocommits each
+                # statement, so the schema is wrapped in a single transaction.
+                conn.executescript(
+                    "PRAGMA journal_mode=OFF;\n"
+                    "PRAGMA synchronous=OFF;\n"
+                    f"BEGIN;\n{f.read()}\nCOMMIT;"
+                )
             LOGGER.info("Recreated schema from schema.sql")
+        finally:
+            conn.close()
 
     def run_etl(self) -> None:
         """Runs the full ETL pipeline using DataPipeline."""
         pipeline = DataPipeline(self.db_path)
         pipeline.run()
 
-    @staticmethod
-    def run_analysis() -> None:
+    def run_analysis(self) -> None:
         """Executes all analysis jobs using the MissionAnalyzer service.
 
+        Jobs run in sequence on a single analyzer, so they share one SQLite connection,
+        its `launch_flat` table, and the in-memory query cache. Each job's queries run
+        inside one read transaction.
+
         This includes:
         - Trend visualizations
         - Launchpad and payload analytics
@@ -60,15 +90,10 @@ class MainPipeline:
 
         Outputs charts, CSVs, and summaries to the `analysis/plots/` directory.
         """
-        analyzer = MissionAnalyzer(db_path=Path("data/spacex.sqlite"))
-
-        analyzer.launches_per_year()
-        analyzer.rocket_success_rates()
-        analyzer.payload_mass_over_time()
-        analyzer.launchpad_performance()
-        analyzer.plan_successful_launch()
-        analyzer.analyze_config_stability()
-        analyzer.detect_rocket_fatigue()
+        with MissionAnalyzer(db_path=self.db_path) as analyzer:
+            for job in ANALYSIS_JOBS:
+                with analyzer.db.read_transaction():
+                    getattr(analyzer, job)()
 
     def run_all(self) -> None:
         """Executes the entire pipeline from schema reset to analysis."""
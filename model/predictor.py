@@ -6,11 +6,27 @@ produces a success probability based on historical data patterns.
 
 """
 
+import functools
+from typing import Any
+
 import joblib
-import pandas as pd
+import numpy as np
+
+MODEL_PATH = "model/models/success_model.pkl"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_model() -> tuple[Any, dict[str, int]]:
+    """Loads the trained model on first use and indexes its feature columns.
 
-# Load trained model and feature columns
-model, columns = joblib.load("model/models/success_model.pkl")
+    Returns:
+        tuple[Any, dict[str, int]]: The XGBoost booster, and the position of each one-hot
+            feature (e.g. "rocket_Falcon 9") in the model's input row, matching the
+            `pd.get_dummies` column names used at training time.
+    """
+    model, columns = joblib.load(MODEL_PATH)
+    column_index = {column: index for index, column in enumerate(columns)}
+    return model.get_booster(), column_index
 
 
 def predict_successful_launch(
@@ -30,13 +46,21 @@ def predict_successful_launch(
     Returns:
         float: Estimated success probability as a percentage (e.g., 94.25).
     """
-    dataframe = pd.DataFrame([{
-        "rocket": rocket,
-        "launchpad": launchpad,
-        "orbit": orbit,
-        "mass_bin": mass_bin
-    }])
-    dataframe_encoded = pd.get_dummies(dataframe).reindex(columns=columns, fill_value=0)
-    prob = model.predict_proba(dataframe_encoded)[0][1]
+    booster, column_index = _load_model()
+
+    features = np.zeros((1, len(column_index)), dtype=np.float32)
+    for prefix, value in (
+        ("rocket", rocket),
+        ("launchpad", launchpad),
+        ("orbit", orbit),
+        ("mass_bin", mass_bin)
+    ):
+        # Categories unseen during training have no column and stay all-zero
+        index = column_index.get(f"{prefix}_{value}")
+        if index is not None:
+            features[0, index] = 1.0
+
+    # Binary logistic objective: the booster returns the positive-class probability
+    prob = booster.inplace_predict(features)[0]
 
     return round(prob * 100, 2)
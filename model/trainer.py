@@ -16,6 +16,9 @@ import joblib
 import pandas as pd
 from xgboost import XGBClassifier
 
+# Payload mass bins, in order; must match the labels offered by the dashboard
+MASS_BINS = ["0–500", "500–2000", "2000+"]
+
 
 def train_and_save_model(
     db_path: str = "data/spacex.sqlite",
@@ -34,7 +37,12 @@ def train_and_save_model(
             r.name AS rocket,
             lp.name AS launchpad,
             p.orbit,
-            p.mass_kg,
+            CASE
+                WHEN p.mass_kg <= 0 THEN NULL
+                WHEN p.mass_kg <= 500 THEN '0–500'
+                WHEN p.mass_kg <= 2000 THEN '500–2000'
+                ELSE '2000+'
+            END AS mass_bin,
             l.success
         FROM launches l
         JOIN rockets r ON l.rocket_id = r.id
@@ -47,12 +55,9 @@ def train_and_save_model(
     """, conn)
     conn.close()
 
-    # Feature engineering
-    df["mass_bin"] = pd.cut(
-        df["mass_kg"],
-        bins=[0, 500, 2000, float("inf")],
-        labels=["0–500", "500–2000", "2000+"]
-    )
+    # Mass bins are computed in SQL with right-closed edges; a fixed categorical keeps
+    # every bin's one-hot column, in bin order, even when a bin has no rows
+    df["mass_bin"] = df["mass_bin"].astype(pd.CategoricalDtype(MASS_BINS))
     df["success"] = df["success"].astype(int)
 
     features = df[["rocket", "launchpad", "orbit", "mass_bin"]]
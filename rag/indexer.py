@@ -4,27 +4,22 @@ Embeds CSV summaries and markdown reports into a ChromaDB vector store
 to support natural language querying via LLMs.
 """
 
-import os
 from pathlib import Path
 
-from dotenv import load_dotenv
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from langchain_chroma import Chroma
 from langchain_community.document_loaders import CSVLoader, TextLoader
 from langchain_openai import OpenAIEmbeddings
 
+from core.env import get_openai_api_key
 from core.logging import LOGGER
 
-# Load OpenAI key
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
-if not OPENAI_API_KEY:
-    LOGGER.info("🔒 OpenAI API key not found. RAG querying will be disabled.")
-
 # Paths
 DATA_DIR = Path("analysis/plots")
 CHROMA_DIR = Path("chroma_store")
+EMBEDDING_CACHE_DIR = Path("embedding_cache")
 
 
 def build_vector_store() -> None:
@@ -45,7 +40,7 @@ def build_vector_store() -> None:
     Returns:
         None
     """
-    if not OPENAI_API_KEY:
+    if not get_openai_api_key():
         LOGGER.warning("🔒 OpenAI API key not found — skipping vector store build.")
         return
 
@@ -65,7 +60,14 @@ def build_vector_store() -> None:
     splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
     split_docs = splitter.split_documents(all_docs)
 
-    embeddings = OpenAIEmbeddings()
+    # Unchanged chunks are served from the local cache (keyed by a hash of the chunk
+    # text, namespaced per embedding model) instead of being re-embedded over the API
+    openai_embeddings = OpenAIEmbeddings()
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        openai_embeddings,
+        LocalFileStore(str(EMBEDDING_CACHE_DIR)),
+        namespace=openai_embeddings.model
+    )
     Chroma.from_documents(
         split_docs,
         embeddings,
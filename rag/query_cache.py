@@ -0,0 +1,236 @@
+"""Answer caches for LaunchLens RAG queries.
+
+`ExactQueryCache` returns answers for verbatim repeats without any API call.
+`SemanticQueryCache` stores the embedding of each answered question alongside its answer;
+a new question whose embedding is close enough (by cosine similarity) to a cached one,
+and that names the same numbers and entities, reuses that answer, skipping retrieval
+and the LLM call entirely. `LRUByteStore` bounds the memoized query embeddings.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator, Sequence
+
+import numpy as np
+from langchain_core.stores import ByteStore
+
+_WORD = re.compile(r"[\w.-]+")
+
+
+def _key_terms(question: str) -> frozenset[str]:
+    """Returns the numbers and named entities in a question, case-folded.
+
+    A term is any word containing a digit ("2019", "39A"), an acronym ("LEO"), or a
+    capitalized word after the first ("Falcon", "Heavy"). Embeddings of "success rate
+    in 2019" and "success rate in 2020" are nearly identical; their terms are not.
+
+    Args:
+        question (str): Natural language question.
+
+    Returns:
+        frozenset[str]: Terms that must match for a cached answer to be reused.
+    """
+    words = [word.strip(".-") for word in _WORD.findall(question)]
+    return frozenset(
+        word.casefold()
+        for position, word in enumerate(words)
+        if word and (
+            any(char.isdigit() for char in word)
+            or (word.isupper() and len(word) > 1)
+            or (position > 0 and word[0].isupper())
+        )
+    )
+
+
+class ExactQueryCache:
+    """Thread-safe LRU mapping of exact question keys to answers."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached answers.
+        """
+        self.max_entries = max_entries
+
+        self._answers: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        """Returns the cached answer for a key, or None on a miss.
+
+        Args:
+            key (Hashable): Normalized question key.
+
+        Returns:
+            str | None: The cached answer, or None on a cache miss.
+        """
+        with self._lock:
+            answer = self._answers.get(key)
+            if answer is not None:
+                self._answers.move_to_end(key)
+            return answer
+
+    def put(self, key: Hashable, answer: str) -> None:
+        """Caches an answer, evicting the least recently used entry when full.
+
+        Args:
+            key (Hashable): Normalized question key.
+            answer (str): Answer to return for this key.
+        """
+        with self._lock:
+            self._answers[key] = answer
+            self._answers.move_to_end(key)
+            if len(self._answers) > self.max_entries:
+                self._answers.popitem(last=False)
+
+
+class LRUByteStore(ByteStore):
+    """Thread-safe in-memory byte store that evicts least recently used keys when full.
+
+    Drop-in for `InMemoryByteStore` where the stored values (e.g. one embedding per
+    distinct question) would otherwise grow for the life of the process.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        """Initializes an empty store.
+
+        Args:
+            max_entries (int): Maximum number of stored values.
+        """
+        self.max_entries = max_entries
+
+        self._values: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mget(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Returns the stored value for each key, or None for missing keys."""
+        with self._lock:
+            values = []
+            for key in keys:
+                value = self._values.get(key)
+                if value is not None:
+                    self._values.move_to_end(key)
+                values.append(value)
+            return values
+
+    def mset(self, key_value_pairs: Sequence[tuple[str, bytes]]) -> None:
+        """Stores each value, evicting the least recently used keys beyond the limit."""
+        with self._lock:
+            for key, value in key_value_pairs:
+                self._values[key] = value
+                self._values.move_to_end(key)
+            while len(self._values) > self.max_entries:
+                self._values.popitem(last=False)
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        """Removes the given keys, ignoring any that are not stored."""
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def yield_keys(self, prefix: str | None = None) -> Iterator[str]:
+        """Yields the stored keys, optionally only those starting with `prefix`."""
+        with self._lock:
+            keys = list(self._values)
+        for key in keys:
+            if prefix is None or key.startswith(prefix):
+                yield key
+
+
+class SemanticQueryCache:
+    """Thread-safe map of question embeddings to answers, matching near-duplicates.
+
+    Lookups are a single matrix-vector product over the L2-normalized cached embeddings.
+    Once full, the least recently used entry is overwritten.
+
+    A hit also requires the same `_key_terms`: questions about different years or
+    rockets can embed above any useful threshold, so similarity alone is not enough.
+
+    OpenAI embeddings place most related questions above 0.9 cosine similarity, and
+    questions with opposite meaning ("highest" vs "lowest success rate") can still score
+    above 0.95, so the default threshold only matches rewordings of the same question.
+    """
+
+    def __init__(self, threshold: float = 0.99, max_entries: int = 1000) -> None:
+        """Initializes an empty cache.
+
+        Args:
+            threshold (float): Minimum cosine similarity for a cached answer to be reused.
+            max_entries (int): Maximum number of cached question/answer pairs.
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+
+        self._vectors: np.ndarray | None = None
+        self._answers: list[str] = []
+        self._terms: list[frozenset[str]] = []
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector: list[float]) -> np.ndarray:
+        """Returns the vector as a unit-length float32 array."""
+        array = np.asarray(vector, dtype=np.float32)
+        return array / np.linalg.norm(array)
+
+    def lookup(self, vector: list[float], question: str) -> str | None:
+        """Returns the answer for the most similar cached question naming the same terms.
+
+        Args:
+            vector (list[float]): Embedding of the incoming question.
+            question (str): The incoming question, for its key terms.
+
+        Returns:
+            str | None: The cached answer, or None on a cache miss.
+        """
+        normalized = self._normalize(vector)
+        terms = _key_terms(question)
+
+        with self._lock:
+            if not self._answers:
+                return None
+
+            similarities = self._vectors[:len(self._answers)] @ normalized
+            candidates = np.flatnonzero(similarities >= self.threshold)
+            for slot in candidates[np.argsort(-similarities[candidates])]:
+                if self._terms[slot] == terms:
+                    self._clock += 1
+                    self._last_used[slot] = self._clock
+                    return self._answers[slot]
+            return None
+
+    def add(self, vector: list[float], question: str, answer: str) -> None:
+        """Caches an answer under its question's embedding and key terms.
+
+        Args:
+            vector (list[float]): Embedding of the answered question.
+            question (str): The answered question, for its key terms.
+            answer (str): Answer to return for similar questions.
+        """
+        normalized = self._normalize(vector)
+        terms = _key_terms(question)
+
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty(
+                    (self.max_entries, normalized.size), dtype=np.float32
+                )
+
+            # The vector is written before the answer is published, so a row is never
+            # scored while it still holds uninitialized memory.
+            if len(self._answers) < self.max_entries:
+                slot = len(self._answers)
+                self._vectors[slot] = normalized
+                self._terms.append(terms)
+                self._answers.append(answer)
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._vectors[slot] = normalized
+                self._terms[slot] = terms
+                self._answers[slot] = answer
+
+            self._clock += 1
+            self._last_used[slot] = self._clock
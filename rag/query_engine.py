@@ -4,27 +4,226 @@ Loads a persisted ChromaDB vector store and enables semantic querying
 of embedded analysis outputs using OpenAI's GPT-3.5/4.
 """
 
-import os
+import asyncio
+import functools
+from collections.abc import Iterator
 from pathlib import Path
 
-from dotenv import load_dotenv
-from langchain.chains import RetrievalQA
+import httpx
+from langchain.chains import create_retrieval_chain
+from langchain.chains.combine_documents import create_stuff_documents_chain
+from langchain.embeddings import CacheBackedEmbeddings
 from langchain_chroma import Chroma
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from openai import RateLimitError
+
+from core.env import get_openai_api_key
 from core.logging import LOGGER
+from rag.query_cache import ExactQueryCache, LRUByteStore, SemanticQueryCache
 
-# Load environment variables
-load_dotenv()
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 CHROMA_DIR = Path("chroma_store")
+MAX_CONCURRENT_QUERIES = 10
+MAX_RATE_LIMIT_RETRIES = 5
+
+HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20)
+
+# Same wording as RetrievalQA's default "stuff" prompt for chat models
+QA_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        (
+            "system",
+            "Use the following pieces of context to answer the user's question.\n"
+            "If you don't know the answer, just say that you don't know, "
+            "don't try to make up an answer.\n"
+            "----------------\n"
+            "{context}"
+        ),
+        ("human", "{input}"),
+    ]
+)
+
+_EXACT_ANSWERS = ExactQueryCache()
+
+
+def _store_version() -> int:
+    """Returns the newest modification time under `CHROMA_DIR`, or 0 if it is missing.
+
+    Passed to the cached builders below and folded into the exact-answer key, so a
+    vector store rebuilt while the app is running replaces the open collection, the
+    chains over it, and every answer cached from it.
+
+    Returns:
+        int: Latest `st_mtime_ns` of the store directory and its files.
+    """
+    if not CHROMA_DIR.exists():
+        return 0
+    return max(
+        path.stat().st_mtime_ns for path in (CHROMA_DIR, *CHROMA_DIR.rglob("*"))
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_http_client() -> httpx.Client:
+    """Returns the HTTP/2 client shared by every synchronous OpenAI call.
+
+    One pool per process keeps TLS connections alive across questions. Async calls use
+    a client per batch instead (see `aquery_batch`), since an async pool is bound to the
+    event loop that first used it.
+
+    Returns:
+        httpx.Client: Pooled HTTP/2 client.
+    """
+    return httpx.Client(http2=True, limits=HTTP_LIMITS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_embeddings() -> CacheBackedEmbeddings:
+    """Returns the shared query embedder.
+
+    Query embeddings are memoized in a bounded in-memory LRU, so the vector computed for
+    the answer cache lookup is reused by the retriever instead of being requested from
+    OpenAI twice.
+
+    Returns:
+        CacheBackedEmbeddings: OpenAI embeddings with an in-memory query cache.
+    """
+    return CacheBackedEmbeddings.from_bytes_store(
+        OpenAIEmbeddings(http_client=_get_http_client()),
+        LRUByteStore(),
+        query_embedding_cache=True
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _get_answer_cache(model_name: str, store_version: int) -> SemanticQueryCache:
+    """Returns the semantic answer cache for a model and vector store version.
+
+    Args:
+        model_name (str): OpenAI chat model whose answers are cached.
+        store_version (int): `_store_version()` the cached answers were retrieved from.
+
+    Returns:
+        SemanticQueryCache: Cache of previously answered questions.
+    """
+    return SemanticQueryCache()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_vectordb(store_version: int) -> Chroma:
+    """Opens the persisted LaunchLens vector store once per store version.
+
+    Args:
+        store_version (int): `_store_version()` of the store on disk.
+
+    Returns:
+        Chroma: Vector store backed by `CHROMA_DIR`.
+    """
+    return Chroma(persist_directory=str(CHROMA_DIR), embedding_function=_get_embeddings())
+
+
+def _build_qa_chain(
+    model_name: str,
+    store_version: int,
+    http_async_client: httpx.AsyncClient | None = None
+) -> Runnable:
+    """Builds a retrieval QA chain over the shared vector store.
+
+    The chain takes `{"input": question}` and returns the retrieved `context` and the
+    generated `answer`; streaming it yields the answer in pieces as they are generated.
+
+    Args:
+        model_name (str): OpenAI chat model used to answer questions.
+        store_version (int): `_store_version()` of the store to retrieve from.
+        http_async_client (httpx.AsyncClient | None): Client for async LLM calls, bound to
+            the running event loop. Omit for chains only invoked synchronously.
+
+    Returns:
+        Runnable: Chain over the persisted LaunchLens vector store.
+    """
+    retriever = _get_vectordb(store_version).as_retriever(search_kwargs={"k": 5})
+    llm = ChatOpenAI(
+        model_name=model_name,
+        temperature=0,
+        http_client=_get_http_client(),
+        http_async_client=http_async_client
+    )
+
+    return create_retrieval_chain(retriever, create_stuff_documents_chain(llm, QA_PROMPT))
+
+
+@functools.lru_cache(maxsize=4)
+def _get_qa_chain(model_name: str, store_version: int) -> Runnable:
+    """Builds the synchronous retrieval QA chain once per model and store version.
+
+    Keeps the OpenAI clients (and their pooled HTTPS connections) and the opened
+    Chroma collection alive between queries.
 
-if not OPENAI_API_KEY:
-    LOGGER("🔒 OpenAI API key not found. Query functionality will be disabled.")
+    Args:
+        model_name (str): OpenAI chat model used to answer questions.
+        store_version (int): `_store_version()` of the store to retrieve from.
+
+    Returns:
+        Runnable: Chain over the persisted LaunchLens vector store.
+    """
+    return _build_qa_chain(model_name, store_version)
+
+
+def stream_launchlens(question: str, model_name: str = "gpt-3.5-turbo") -> Iterator[str]:
+    """Streams the answer to a user question as the LLM generates it.
+
+    The answer comes from the cached QA chain's own streaming output. Exact repeats
+    (ignoring case and surrounding whitespace) are answered without any API call, and
+    near-duplicates of an answered question without retrieval or the LLM; cached
+    answers are yielded whole.
+
+    Args:
+        question (str): The user’s natural language query.
+        model_name (str): OpenAI model to use (default: gpt-3.5-turbo)
+
+    Yields:
+        str: Successive pieces of the answer. Nothing is yielded if the OpenAI key is
+        not configured.
+    """
+    if not get_openai_api_key():
+        LOGGER.warning("🔒 OpenAI API key not found — query functionality is disabled.")
+        return
+
+    store_version = _store_version()
+    exact_key = (model_name, store_version, question.strip().lower())
+    cached_answer = _EXACT_ANSWERS.get(exact_key)
+    if cached_answer is not None:
+        yield cached_answer
+        return
+
+    answer_cache = _get_answer_cache(model_name, store_version)
+    question_vector = _get_embeddings().embed_query(question)
+
+    cached_answer = answer_cache.lookup(question_vector, question)
+    if cached_answer is not None:
+        _EXACT_ANSWERS.put(exact_key, cached_answer)
+        yield cached_answer
+        return
+
+    pieces = []
+    for chunk in _get_qa_chain(model_name, store_version).stream({"input": question}):
+        # The chain also emits the echoed input and retrieved context as chunks
+        if "answer" in chunk:
+            pieces.append(chunk["answer"])
+            yield chunk["answer"]
+
+    answer = "".join(pieces)
+    answer_cache.add(question_vector, question, answer)
+    _EXACT_ANSWERS.put(exact_key, answer)
 
 
 def query_launchlens(question: str, model_name: str = "gpt-3.5-turbo") -> str | None:
     """Answers a user question based on embedded LaunchLens content using a RAG pipeline.
 
+    Blocking counterpart of `stream_launchlens`, sharing its cached chain and answer
+    caches.
+
     Args:
         question (str): The user’s natural language query.
         model_name (str): OpenAI model to use (default: gpt-3.5-turbo)
@@ -32,21 +231,119 @@ def query_launchlens(question: str, model_name: str = "gpt-3.5-turbo") -> str |
     Returns:
         Optional[str]: LLM-generated answer, or None if OpenAI key is not configured.
     """
-    if not OPENAI_API_KEY:
-        return None
+    return "".join(stream_launchlens(question, model_name)) or None
 
-    embeddings = OpenAIEmbeddings()
-    vectordb = Chroma(persist_directory=str(CHROMA_DIR), embedding_function=embeddings)
 
-    retriever = vectordb.as_retriever(search_kwargs={"k": 5})
-    llm = ChatOpenAI(model_name=model_name, temperature=0)
+async def _aanswer(
+    question: str,
+    model_name: str,
+    store_version: int,
+    qa_chain: Runnable,
+    semaphore: asyncio.Semaphore
+) -> str:
+    """Answers one question on the async chain, retrying with backoff when rate limited.
 
-    qa_chain = RetrievalQA.from_chain_type(
-        llm=llm,
-        retriever=retriever,
-        return_source_documents=False
-    )
+    Args:
+        question (str): The user’s natural language query.
+        model_name (str): OpenAI model the chain uses, for the answer caches.
+        store_version (int): `_store_version()` the chain retrieves from.
+        qa_chain (Runnable): Chain bound to the running event loop.
+        semaphore (asyncio.Semaphore): Limit on concurrent chain invocations.
+
+    Returns:
+        str: LLM-generated or cached answer.
+    """
+    exact_key = (model_name, store_version, question.strip().lower())
+    cached_answer = _EXACT_ANSWERS.get(exact_key)
+    if cached_answer is not None:
+        return cached_answer
+
+    answer_cache = _get_answer_cache(model_name, store_version)
 
-    response = qa_chain.invoke({"query": question})
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        try:
+            async with semaphore:
+                # Embedded on the process-wide sync client; the chain's retriever then
+                # finds the vector in the embeddings' query cache instead of calling
+                # OpenAI again, and so does a retry.
+                question_vector = await asyncio.to_thread(
+                    _get_embeddings().embed_query, question
+                )
 
-    return response["result"]
+                cached_answer = answer_cache.lookup(question_vector, question)
+                if cached_answer is not None:
+                    _EXACT_ANSWERS.put(exact_key, cached_answer)
+                    return cached_answer
+
+                response = await qa_chain.ainvoke({"input": question})
+            break
+        except RateLimitError:
+            if attempt == MAX_RATE_LIMIT_RETRIES:
+                raise
+            delay = 2 ** attempt
+            LOGGER.warning(f"⏳ Rate limited by OpenAI — retrying in {delay}s.")
+            await asyncio.sleep(delay)
+
+    answer_cache.add(question_vector, question, response["answer"])
+    _EXACT_ANSWERS.put(exact_key, response["answer"])
+
+    return response["answer"]
+
+
+async def aquery_batch(
+    questions: list[str],
+    model_name: str = "gpt-3.5-turbo"
+) -> list[str | None]:
+    """Answers several questions concurrently.
+
+    At most `MAX_CONCURRENT_QUERIES` questions are being embedded or answered at once,
+    sharing one HTTP/2 client that is opened for this batch and closed when it finishes.
+    A question that fails is logged and answered with None without cancelling the rest.
+
+    Args:
+        questions (list[str]): Natural language queries to answer.
+        model_name (str): OpenAI model to use (default: gpt-3.5-turbo)
+
+    Returns:
+        list[Optional[str]]: Answers in the same order as `questions` (None for failed
+        questions), or all None if the OpenAI key is not configured.
+    """
+    if not get_openai_api_key():
+        LOGGER.warning("🔒 OpenAI API key not found — query functionality is disabled.")
+        return [None] * len(questions)
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    store_version = _store_version()
+
+    async with httpx.AsyncClient(http2=True, limits=HTTP_LIMITS) as http_async_client:
+        qa_chain = _build_qa_chain(model_name, store_version, http_async_client)
+        results = await asyncio.gather(
+            *(
+                _aanswer(question, model_name, store_version, qa_chain, semaphore)
+                for question in questions
+            ),
+            return_exceptions=True
+        )
+
+    answers = []
+    for question, result in zip(questions, results, strict=True):
+        if isinstance(result, Exception):
+            LOGGER.error(f"Failed to answer {question!r}: {result}")
+            answers.append(None)
+        else:
+            answers.append(result)
+    return answers
+
+
+async def aquery_launchlens(question: str, model_name: str = "gpt-3.5-turbo") -> str | None:
+    """Async variant of `query_launchlens`, retrying with exponential backoff when rate limited.
+
+    Args:
+        question (str): The user’s natural language query.
+        model_name (str): OpenAI model to use (default: gpt-3.5-turbo)
+
+    Returns:
+        Optional[str]: LLM-generated answer, or None if OpenAI key is not configured.
+    """
+    answers = await aquery_batch([question], model_name)
+    return answers[0]
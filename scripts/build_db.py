@@ -1,4 +1,4 @@
-"""Initializes the SQLite database by executing the schema defined in schema/schema.sql.
+"""Initializes the SQLite database by executing the schema defined in data/schema.sql.
 
 Creates a new database file at data/spacex.sqlite if it doesn't exist.
 Intended to be run before any ETL scripts.
@@ -8,7 +8,17 @@ import sqlite3
 from pathlib import Path
 
 DB_PATH: Path = Path("data/spacex.sqlite")
-SCHEMA_PATH: Path = Path("schema/schema.sql")
+SCHEMA_PATH: Path = Path("data/schema.sql")
+
+# page_size only applies before the first table is created, and cannot change once the
+# database is in WAL mode, so it must come first. WAL mode persists in the file for the
+# ETL writes that follow; synchronous is per-connection and only relaxes the fsyncs made
+# while applying the schema here.
+BUILD_PRAGMAS: str = (
+    "PRAGMA page_size=8192;\n"
+    "PRAGMA journal_mode=WAL;\n"
+    "PRAGMA synchronous=NORMAL;\n"
+)
 
 
 def build_database() -> None:
@@ -17,7 +27,10 @@ def build_database() -> None:
         raise FileNotFoundError(f"Schema file not found: {SCHEMA_PATH}")
 
     with sqlite3.connect(DB_PATH) as conn:
-        conn.executescript(SCHEMA_PATH.read_text())
+        # executescript autocommits each statement, so the DDL is wrapped in one
+        # transaction; the pragmas stay outside it since journal_mode cannot change
+        # mid-transaction.
+        conn.executescript(f"{BUILD_PRAGMAS}BEGIN;\n{SCHEMA_PATH.read_text()}\nCOMMIT;")
 
     print(f"✅ Database created at {DB_PATH}")
 